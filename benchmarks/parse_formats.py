@@ -0,0 +1,100 @@
+"""
+Benchmark of the USGS response parsers, to choose the cheaper wire format per query.
+
+Compares payload size and parsing time of the CSV and GeoJSON formats, either on responses saved from the API:
+
+    python benchmarks/parse_formats.py --csv query.csv --geojson query.geojson
+
+or on synthetic responses of a given number of events:
+
+    python benchmarks/parse_formats.py --events 20000
+"""
+# import from standard library
+import argparse
+import json
+import timeit
+from pathlib import Path
+# import from installed packages
+import numpy as np
+import pandas as pd
+# import from project
+from earthquakes.parsers import parse_response, CSV_COLUMNS
+
+
+def build_synthetic_responses(number_of_events, seed=0):
+    """
+    Function to build CSV and GeoJSON responses describing the same random events
+
+    :param number_of_events: number of events in each response
+    :param seed: seed of the random generator
+    :return: a tuple (csv, geojson) of response bodies, as bytes
+    """
+    rng = np.random.default_rng(seed)
+    times = rng.integers(631152000000, 1640995200000, number_of_events)
+    latitudes = rng.uniform(34, 42, number_of_events).round(4)
+    longitudes = rng.uniform(19, 29, number_of_events).round(4)
+    depths = rng.uniform(0, 100, number_of_events).round(2)
+    magnitudes = rng.uniform(2.5, 7.5, number_of_events).round(1)
+    identifiers = [f'us{index:08d}' for index in range(number_of_events)]
+    places = [f'{distance} km SW of Somewhere, Greece' for distance in rng.integers(1, 100, number_of_events)]
+
+    features = []
+    for index in range(number_of_events):
+        features.append({
+            "type": "Feature",
+            "properties": {"mag": magnitudes[index], "place": places[index], "time": int(times[index]),
+                           "updated": int(times[index]), "tz": None,
+                           "url": f"https://earthquake.usgs.gov/earthquakes/eventpage/{identifiers[index]}",
+                           "detail": f"https://earthquake.usgs.gov/fdsnws/event/1/query?eventid={identifiers[index]}"
+                                     f"&format=geojson",
+                           "felt": None, "cdi": None, "mmi": None,
+                           "alert": None, "status": "reviewed", "tsunami": 0, "sig": 300, "net": "us",
+                           "code": identifiers[index][2:], "ids": f",{identifiers[index]},", "sources": ",us,",
+                           "types": ",origin,phase-data,", "nst": None, "dmin": 0.5, "rms": 0.7, "gap": 50,
+                           "magType": "mb", "type": "earthquake", "title": f"M {magnitudes[index]} - Greece"},
+            "geometry": {"type": "Point", "coordinates": [longitudes[index], latitudes[index], depths[index]]},
+            "id": identifiers[index]})
+    geojson = json.dumps({"type": "FeatureCollection",
+                          "metadata": {"generated": 0, "url": "", "title": "USGS Earthquakes", "status": 200,
+                                       "api": "1.13.1", "count": number_of_events},
+                          "features": features}, separators=(',', ':')).encode()
+
+    iso_times = pd.to_datetime(times, unit='ms', utc=True).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    csv_data = pd.DataFrame({column: np.nan for column in CSV_COLUMNS}, index=range(number_of_events))
+    csv_data = csv_data.assign(time=iso_times, latitude=latitudes, longitude=longitudes, depth=depths,
+                               mag=magnitudes, magType='mb', gap=50, dmin=0.5, rms=0.7, net='us', id=identifiers,
+                               updated=iso_times, place=places, type='earthquake', status='reviewed',
+                               locationSource='us', magSource='us')
+    csv = csv_data.to_csv(index=False).encode()
+    return csv, geojson
+
+
+def time_parser(parser, content, repeat):
+    return min(timeit.repeat(lambda: parser(content), number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the cost of parsing the CSV and GeoJSON formats.')
+    parser.add_argument('--csv', type=Path, help='CSV response saved from the API')
+    parser.add_argument('--geojson', type=Path, help='GeoJSON response of the same query')
+    parser.add_argument('--events', type=int, default=20000, help='number of synthetic events')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed runs, the best one is reported')
+    args = parser.parse_args()
+
+    if args.csv and args.geojson:
+        csv, geojson = args.csv.read_bytes(), args.geojson.read_bytes()
+    else:
+        csv, geojson = build_synthetic_responses(args.events)
+
+    results = [
+        ('csv', len(csv), time_parser(lambda content: parse_response(content, 'csv'), csv, args.repeat)),
+        ('geojson', len(geojson), time_parser(lambda content: parse_response(content, 'geojson'), geojson,
+                                              args.repeat)),
+    ]
+    print(f"{'format':<24}{'size (kB)':>12}{'parse (ms)':>12}")
+    for name, size, seconds in results:
+        print(f"{name:<24}{size / 1000:>12.1f}{seconds * 1000:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
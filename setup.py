@@ -88,4 +88,7 @@ setuptools.setup(
     python_requires=f">={python_version}",
     install_requires=install_requires,
     data_files=data_files,
+    entry_points={
+        "console_scripts": ["earthquakes=earthquakes.cli:main"],
+    },
 )
@@ -0,0 +1,7 @@
+# import from standard library
+import sys
+# import from installed packages
+# import from project
+from earthquakes.cli import main
+
+sys.exit(main())
@@ -0,0 +1,226 @@
+# import from standard library
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+# import from installed packages
+# numpy, pandas and aiohttp are imported inside the commands that need them, so that `--help` and cache hits
+# do not pay for their import time
+# import from project
+
+ASSET_COLUMN = 'asset'
+YEAR_COLUMN = 'year'
+BURNING_COST_COLUMN = 'burning_cost'
+
+
+def main(argv=None):
+    """
+    Entry point of the `earthquakes` command line interface
+
+    :param argv: list of command line arguments, sys.argv[1:] by default
+    :return: exit status of the command
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.command(args)
+
+
+def build_parser():
+    """
+    Function to build the argument parser of the command line interface
+
+    :return: an argparse.ArgumentParser with one sub-command per action
+    """
+    parser = argparse.ArgumentParser(prog='earthquakes', description='Fetch USGS earthquake catalogs and price '
+                                                                     'earthquake covers.')
+    subparsers = parser.add_subparsers(title='commands', dest='command_name', required=True)
+
+    fetch_parser = subparsers.add_parser('fetch', help='fetch the catalog around a single location')
+    fetch_parser.add_argument('--latitude', type=float, required=True, help='latitude in decimal degrees')
+    fetch_parser.add_argument('--longitude', type=float, required=True, help='longitude in decimal degrees')
+    _add_query_arguments(fetch_parser)
+    fetch_parser.set_defaults(command=fetch)
+
+    sync_parser = subparsers.add_parser('sync', help='fetch the catalog around every asset of a portfolio')
+    _add_portfolio_argument(sync_parser)
+    _add_query_arguments(sync_parser)
+    sync_parser.set_defaults(command=sync)
+
+    price_parser = subparsers.add_parser('price', help='compute the yearly payouts of every asset of a portfolio')
+    _add_portfolio_argument(price_parser)
+    _add_pricing_arguments(price_parser)
+    price_parser.set_defaults(command=price)
+
+    burning_cost_parser = subparsers.add_parser('burning-cost',
+                                                help='compute the burning cost of every asset of a portfolio')
+    _add_portfolio_argument(burning_cost_parser)
+    _add_pricing_arguments(burning_cost_parser)
+    burning_cost_parser.add_argument('--start-year', type=int, required=True,
+                                     help='first year to calculate burning cost')
+    burning_cost_parser.add_argument('--end-year', type=int, required=True,
+                                     help='last year to calculate burning cost')
+    burning_cost_parser.set_defaults(command=burning_cost)
+    return parser
+
+
+def fetch(args):
+    """
+    Command to fetch the catalog around a single location and save it. Nothing is fetched if the output already
+    exists, unless --refresh is given.
+    """
+    if _is_cached(args):
+        return 0
+    from earthquakes.usgs_api import get_earthquake_data
+
+    earthquake_data = get_earthquake_data(latitude=args.latitude, longitude=args.longitude,
+                                          **_get_query_kwargs(args))
+    if earthquake_data is None:
+        return 1
+    _write_table(earthquake_data, args.output)
+    return 0
+
+
+def sync(args):
+    """
+    Command to fetch the catalog around every asset of a portfolio and save it. Nothing is fetched if the output
+    already exists, unless --refresh is given.
+    """
+    if _is_cached(args):
+        return 0
+    import asyncio
+    from earthquakes.usgs_api import get_earthquake_data_for_multiple_locations
+    from earthquakes.tools import LATITUDE_COLUMN, LONGITUDE_COLUMN
+
+    portfolio = _read_portfolio(args.portfolio)
+    assets = list(zip(portfolio[LATITUDE_COLUMN], portfolio[LONGITUDE_COLUMN]))
+    earthquake_data = asyncio.run(get_earthquake_data_for_multiple_locations(assets=assets,
+                                                                             **_get_query_kwargs(args)))
+    _write_table(earthquake_data, args.output)
+    return 0
+
+
+def price(args):
+    """
+    Command to compute the yearly payouts of every asset of a portfolio. The output has one row per asset and year.
+    """
+    import pandas as pd
+    from earthquakes.tools import PAYOUT_COLUMN
+
+    portfolio = _read_portfolio(args.portfolio)
+    payouts = []
+    for asset, asset_payouts in _compute_asset_payouts(portfolio, args.catalog, args.tiers):
+        payouts.append(pd.DataFrame({ASSET_COLUMN: asset, YEAR_COLUMN: asset_payouts.index,
+                                     PAYOUT_COLUMN: asset_payouts.to_numpy()}))
+    _write_table(pd.concat(payouts, ignore_index=True), args.output)
+    return 0
+
+
+def burning_cost(args):
+    """
+    Command to compute the burning cost of every asset of a portfolio. The output has one row per asset.
+    """
+    import pandas as pd
+    from earthquakes.tools import compute_burning_cost, LATITUDE_COLUMN, LONGITUDE_COLUMN
+
+    portfolio = _read_portfolio(args.portfolio)
+    burning_costs = [compute_burning_cost(payouts=asset_payouts, start_year=args.start_year, end_year=args.end_year)
+                     for _, asset_payouts in _compute_asset_payouts(portfolio, args.catalog, args.tiers)]
+    _write_table(pd.DataFrame({ASSET_COLUMN: portfolio[ASSET_COLUMN],
+                               LATITUDE_COLUMN: portfolio[LATITUDE_COLUMN],
+                               LONGITUDE_COLUMN: portfolio[LONGITUDE_COLUMN],
+                               BURNING_COST_COLUMN: burning_costs}), args.output)
+    return 0
+
+
+def _add_query_arguments(parser):
+    parser.add_argument('--radius', type=float, help='maximum distance in kilometers to the location')
+    parser.add_argument('--minimum-magnitude', type=float, help='minimum magnitude of the events')
+    parser.add_argument('--end-date', type=_parse_date, help='last day of the catalog, as YYYY-MM-DD')
+    # Formats of earthquakes.parsers.PARSERS, listed here so that `--help` does not import the parsers
+    parser.add_argument('--format', default='csv', choices=['csv', 'geojson', 'text'],
+                        help='format of the API response. Defaults to csv')
+    parser.add_argument('--output', type=Path, required=True, help='output CSV file')
+    parser.add_argument('--refresh', action='store_true', help='fetch the catalog even if the output exists')
+
+
+def _add_portfolio_argument(parser):
+    parser.add_argument('--portfolio', type=Path, required=True,
+                        help='CSV file of assets with latitude and longitude columns and an optional asset column')
+
+
+def _add_pricing_arguments(parser):
+    parser.add_argument('--catalog', type=Path, required=True, help='earthquake catalog, as written by fetch or sync')
+    parser.add_argument('--tier', dest='tiers', nargs=3, type=float, action='append', required=True,
+                        metavar=('RADIUS', 'MAGNITUDE', 'PAYOUT'),
+                        help='payout tier of the structure, can be repeated')
+    parser.add_argument('--output', type=Path, help='output CSV file, stdout by default')
+
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date, expected YYYY-MM-DD: {value}")
+
+
+def _get_query_kwargs(args):
+    kwargs = {'format': args.format}
+    if args.radius is not None:
+        kwargs['radius'] = args.radius
+    if args.minimum_magnitude is not None:
+        kwargs['minimum_magnitude'] = args.minimum_magnitude
+    if args.end_date is not None:
+        kwargs['end_date'] = args.end_date
+    return kwargs
+
+
+def _is_cached(args):
+    if args.output.exists() and not args.refresh:
+        print(f'{args.output} already exists, use --refresh to fetch it again.', file=sys.stderr)
+        return True
+    return False
+
+
+def _read_portfolio(path):
+    import pandas as pd
+    from earthquakes.tools import LATITUDE_COLUMN, LONGITUDE_COLUMN
+
+    portfolio = pd.read_csv(path)
+    missing_columns = {LATITUDE_COLUMN, LONGITUDE_COLUMN} - set(portfolio.columns)
+    if missing_columns:
+        raise ValueError(f"Portfolio is missing columns: {sorted(missing_columns)}")
+    if ASSET_COLUMN not in portfolio:
+        portfolio[ASSET_COLUMN] = portfolio.index
+    return portfolio
+
+
+def _read_table(path):
+    import pandas as pd
+
+    return pd.read_csv(path)
+
+
+def _write_table(data, path):
+    data.to_csv(sys.stdout if path is None else path, index=False)
+
+
+def _compute_asset_payouts(portfolio, catalog_path, payouts_structure):
+    """
+    Generator of the yearly payouts of every asset of a portfolio
+
+    :return: yields (asset, payouts) tuples, payouts being a Pandas Series indexed by year
+    """
+    import pandas as pd
+    from earthquakes.tools import get_haversine_distance, compute_payouts, TIME_COLUMN, DISTANCE_COLUMN, \
+        LATITUDE_COLUMN, LONGITUDE_COLUMN
+
+    earthquake_data = _read_table(catalog_path)
+    # Parse times once rather than once per asset
+    earthquake_data[TIME_COLUMN] = pd.to_datetime(earthquake_data[TIME_COLUMN])
+    for asset, latitude, longitude in zip(portfolio[ASSET_COLUMN], portfolio[LATITUDE_COLUMN],
+                                          portfolio[LONGITUDE_COLUMN]):
+        earthquake_data[DISTANCE_COLUMN] = get_haversine_distance(
+            latitude_list=earthquake_data[LATITUDE_COLUMN], longitude_list=earthquake_data[LONGITUDE_COLUMN],
+            point_latitude=latitude, point_longitude=longitude)
+        yield asset, compute_payouts(earthquake_data=earthquake_data, payouts_structure=payouts_structure,
+                                     return_type='series')
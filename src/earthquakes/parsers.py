@@ -0,0 +1,144 @@
+# import from standard library
+import json
+from io import BytesIO
+# import from installed packages
+import numpy as np
+import pandas as pd
+
+# import from project
+from earthquakes.tools import TIME_COLUMN, LATITUDE_COLUMN, LONGITUDE_COLUMN, DEPTH_COLUMN, MAGNITUDE_COLUMN, \
+    MAGNITUDE_TYPE_COLUMN, NUMBER_SEISMIC_STATIONS_LOCATION_COLUMN, GAP_COLUMN, MIN_DISTANCE_EPICENTER_STATION_COLUMN, \
+    TRAVEL_TIME_RESIDUAL_COLUMN, CONTRIBUTOR_ID_COLUMN, EVENT_IDENTIFIER_COLUMN, TIME_UPDATED_COLUMN, PLACE_COLUMN, \
+    EVENT_TYPE_COLUMN, HORIZONTAL_ERROR_COLUMN, DEPTH_ERROR_COLUMN, MAGNITUDE_ERROR_COLUMN, \
+    NUMBER_SEISMIC_STATIONS_MAGNITUDE_COLUMN, STATUS_COLUMN, LOCATION_SOURCE_COLUMN, MAGNITUDE_SOURCE_COLUMN, \
+    FELT_REPORTS_COLUMN, COMMUNITY_INTENSITY_COLUMN, INSTRUMENTAL_INTENSITY_COLUMN, ALERT_LEVEL_COLUMN, \
+    TSUNAMI_COLUMN, SIGNIFICANCE_COLUMN
+
+# Columns of the USGS CSV format, in order
+CSV_COLUMNS = [TIME_COLUMN, LATITUDE_COLUMN, LONGITUDE_COLUMN, DEPTH_COLUMN, MAGNITUDE_COLUMN, MAGNITUDE_TYPE_COLUMN,
+               NUMBER_SEISMIC_STATIONS_LOCATION_COLUMN, GAP_COLUMN, MIN_DISTANCE_EPICENTER_STATION_COLUMN,
+               TRAVEL_TIME_RESIDUAL_COLUMN, CONTRIBUTOR_ID_COLUMN, EVENT_IDENTIFIER_COLUMN, TIME_UPDATED_COLUMN,
+               PLACE_COLUMN, EVENT_TYPE_COLUMN, HORIZONTAL_ERROR_COLUMN, DEPTH_ERROR_COLUMN, MAGNITUDE_ERROR_COLUMN,
+               NUMBER_SEISMIC_STATIONS_MAGNITUDE_COLUMN, STATUS_COLUMN, LOCATION_SOURCE_COLUMN, MAGNITUDE_SOURCE_COLUMN]
+# Columns only available in the USGS GeoJSON format
+GEOJSON_ONLY_COLUMNS = [FELT_REPORTS_COLUMN, COMMUNITY_INTENSITY_COLUMN, INSTRUMENTAL_INTENSITY_COLUMN,
+                        ALERT_LEVEL_COLUMN, TSUNAMI_COLUMN, SIGNIFICANCE_COLUMN]
+# GeoJSON feature properties, all named as the corresponding catalog columns
+GEOJSON_NUMBER_PROPERTIES = [MAGNITUDE_COLUMN, TIME_COLUMN, TIME_UPDATED_COLUMN, FELT_REPORTS_COLUMN,
+                             COMMUNITY_INTENSITY_COLUMN, INSTRUMENTAL_INTENSITY_COLUMN, TSUNAMI_COLUMN,
+                             SIGNIFICANCE_COLUMN, NUMBER_SEISMIC_STATIONS_LOCATION_COLUMN,
+                             MIN_DISTANCE_EPICENTER_STATION_COLUMN, TRAVEL_TIME_RESIDUAL_COLUMN, GAP_COLUMN]
+GEOJSON_STRING_PROPERTIES = [PLACE_COLUMN, ALERT_LEVEL_COLUMN, STATUS_COLUMN, CONTRIBUTOR_ID_COLUMN,
+                             MAGNITUDE_TYPE_COLUMN]
+# Columns of the USGS text format, mapped to catalog columns
+TEXT_COLUMNS = {'EventID': EVENT_IDENTIFIER_COLUMN, 'Time': TIME_COLUMN, 'Latitude': LATITUDE_COLUMN,
+                'Longitude': LONGITUDE_COLUMN, 'Depth/km': DEPTH_COLUMN, 'Author': LOCATION_SOURCE_COLUMN,
+                'Contributor': CONTRIBUTOR_ID_COLUMN, 'MagType': MAGNITUDE_TYPE_COLUMN, 'Magnitude': MAGNITUDE_COLUMN,
+                'MagAuthor': MAGNITUDE_SOURCE_COLUMN, 'EventLocationName': PLACE_COLUMN,
+                'EventType': EVENT_TYPE_COLUMN}
+
+
+def check_response_format(response_format):
+    """
+    Function to check that a response format can be parsed
+
+    :param response_format: format parameter of the API request, e.g. 'csv' or 'geojson'
+    """
+    if response_format not in PARSERS:
+        raise ValueError(f"Parsing the {response_format} format is not supported. "
+                         f"Supported formats: {sorted(PARSERS)}")
+
+
+def parse_response(content, response_format):
+    """
+    Function to parse the body of a USGS API response into an earthquake catalog
+
+    :param content: body of the API response, as bytes
+    :param response_format: format parameter of the API request, e.g. 'csv' or 'geojson'
+    :return: a dataframe with one row per event and the columns of the CSV format, times are ISO 8601 strings in UTC
+    """
+    check_response_format(response_format)
+    return PARSERS[response_format](content)
+
+
+def parse_csv(content):
+    """
+    Function to parse a USGS CSV response into an earthquake catalog
+
+    :param content: body of the API response, as bytes
+    :return: a dataframe with one row per event, times are kept as ISO 8601 strings as returned by the API
+    """
+    return pd.read_csv(BytesIO(content))
+
+
+def parse_text(content):
+    """
+    Function to parse a USGS pipe-separated text response into an earthquake catalog
+
+    :param content: body of the API response, as bytes
+    :return: a dataframe with one row per event, columns renamed as in the CSV format
+    """
+    earthquake_data = pd.read_csv(BytesIO(content), sep='|')
+    earthquake_data.columns = [column.lstrip('#').strip() for column in earthquake_data.columns]
+    earthquake_data = earthquake_data.rename(columns=TEXT_COLUMNS)
+    # Text times are UTC without a time zone designator
+    earthquake_data[TIME_COLUMN] = _format_times(pd.to_datetime(earthquake_data[TIME_COLUMN], utc=True))
+    return earthquake_data
+
+
+def parse_geojson(content):
+    """
+    Function to parse a USGS GeoJSON response into an earthquake catalog
+
+    :param content: body of the API response, as bytes
+    :return: a dataframe with the CSV format columns, followed by the columns only available in GeoJSON
+    """
+    columns = _decode_geojson_columns(content)
+    number_of_events = len(columns[EVENT_IDENTIFIER_COLUMN])
+    earthquake_data = pd.DataFrame({column: columns.get(column, np.full(number_of_events, np.nan))
+                                    for column in CSV_COLUMNS + GEOJSON_ONLY_COLUMNS})
+    # GeoJSON times are milliseconds since epoch
+    for column in [TIME_COLUMN, TIME_UPDATED_COLUMN]:
+        earthquake_data[column] = _format_times(pd.to_datetime(earthquake_data[column], unit='ms', utc=True))
+    return earthquake_data
+
+
+def _format_times(times):
+    """
+    Function to format UTC datetimes as in the USGS CSV format, e.g. 2021-10-12T09:24:05.099Z
+
+    :param times: Pandas Series of UTC datetimes
+    :return: a numpy array of strings, None where the time is missing
+    """
+    formatted_times = np.char.add(np.datetime_as_string(times.to_numpy(dtype='datetime64[ms]'), unit='ms'), 'Z')
+    return np.where(times.isna(), None, formatted_times)
+
+
+def _decode_geojson_columns(content):
+    """
+    Function to extract the catalog columns of a GeoJSON response
+
+    :return: a dict of columns, numeric columns as numpy arrays
+    """
+    property_names = GEOJSON_NUMBER_PROPERTIES + GEOJSON_STRING_PROPERTIES + [EVENT_TYPE_COLUMN]
+    names = property_names + [EVENT_IDENTIFIER_COLUMN, LONGITUDE_COLUMN, LATITUDE_COLUMN, DEPTH_COLUMN]
+    rows = []
+    # Single pass over the features, the rows are transposed into columns afterwards
+    for feature in json.loads(content)['features']:
+        properties = feature['properties']
+        coordinates = feature['geometry']['coordinates']
+        rows.append([properties.get(name) for name in property_names] +
+                    [feature.get('id'), coordinates[0], coordinates[1],
+                     coordinates[2] if len(coordinates) > 2 else None])
+    columns = dict(zip(names, zip(*rows))) if rows else {name: [] for name in names}
+    for name in GEOJSON_NUMBER_PROPERTIES + [LONGITUDE_COLUMN, LATITUDE_COLUMN, DEPTH_COLUMN]:
+        columns[name] = np.array(columns[name], dtype=float)
+    return columns
+
+
+# Parsers of the response formats, the other valid API formats are not supported
+PARSERS = {
+    'csv': parse_csv,
+    'geojson': parse_geojson,
+    'text': parse_text,
+}
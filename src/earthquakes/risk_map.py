@@ -0,0 +1,107 @@
+# import from standard library
+import math
+# import from installed packages
+import numpy as np
+
+# import from project
+from earthquakes.tools import prepare_events, get_nearby_event_mask, get_pairwise_haversine_distances
+
+# Number of grid cells evaluated together, as square tiles of the raster. Memory grows with block_size x number of
+# nearby events.
+DEFAULT_BLOCK_SIZE = 512
+
+
+def get_grid_coordinates(min_latitude, max_latitude, min_longitude, max_longitude, resolution):
+    """
+    Function to build the latitude and longitude axes of a regular raster covering a bounding box
+
+    :param min_latitude: southern bound of the raster in decimal degrees
+    :param max_latitude: northern bound of the raster in decimal degrees
+    :param min_longitude: western bound of the raster in decimal degrees
+    :param max_longitude: eastern bound of the raster in decimal degrees
+    :param resolution: spacing between two neighbouring grid points in decimal degrees
+    :return: a tuple (latitudes, longitudes) of 1-D numpy arrays, both in ascending order
+    """
+    if resolution <= 0:
+        raise ValueError("Resolution must be strictly positive.")
+    if min_latitude > max_latitude or min_longitude > max_longitude:
+        raise ValueError("Minimum bounds must be lower than or equal to maximum bounds.")
+    if min_latitude < -90 or max_latitude > 90 or min_longitude < -180 or max_longitude > 180:
+        raise ValueError("Bounding box is outside latitude or longitude bounds.")
+    # Count points rather than using np.arange to avoid dropping the last one to rounding errors
+    number_of_latitudes = int(round((max_latitude - min_latitude) / resolution)) + 1
+    number_of_longitudes = int(round((max_longitude - min_longitude) / resolution)) + 1
+    latitudes = min_latitude + resolution * np.arange(number_of_latitudes)
+    longitudes = min_longitude + resolution * np.arange(number_of_longitudes)
+    return latitudes, longitudes
+
+
+def compute_burning_cost_map(min_latitude, max_latitude, min_longitude, max_longitude, resolution,
+                             payouts_structure, earthquake_data, start_year, end_year,
+                             block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Function to compute the burning cost of every point of a regular latitude/longitude raster. This gives the same
+    result as calling get_haversine_distance, compute_payouts and compute_burning_cost for each grid point, but grid
+    points are evaluated in vectorized blocks and only events closer than the largest payout radius are considered.
+
+    :param min_latitude: southern bound of the raster in decimal degrees
+    :param max_latitude: northern bound of the raster in decimal degrees
+    :param min_longitude: western bound of the raster in decimal degrees
+    :param max_longitude: eastern bound of the raster in decimal degrees
+    :param resolution: spacing between two neighbouring grid points in decimal degrees
+    :param payouts_structure: the payouts structure that defines how much is paid per year. List of lists.
+    :param earthquake_data: the historical earthquake data, with time, latitude, longitude and magnitude columns
+    :param start_year: First year to calculate burning cost
+    :param end_year: Last year to calculate burning cost
+    :param block_size: maximum number of grid points evaluated together, as a square tile of the raster
+    :return: 2-D numpy array of burning costs, rows follow ascending latitudes and columns ascending longitudes
+    """
+    if not payouts_structure:
+        raise ValueError('Provided payouts structure is empty.')
+    if start_year > end_year:
+        raise ValueError('Start year must be lower than or equal to end year.')
+    if block_size < 1:
+        raise ValueError('Block size must be strictly positive.')
+    latitudes, longitudes = get_grid_coordinates(min_latitude=min_latitude, max_latitude=max_latitude,
+                                                 min_longitude=min_longitude, max_longitude=max_longitude,
+                                                 resolution=resolution)
+    burning_costs = np.zeros((latitudes.size, longitudes.size))
+
+    tiers = np.asarray(payouts_structure, dtype=float)
+    tier_radii, tier_magnitudes, tier_payouts = tiers[:, 0], tiers[:, 1], tiers[:, 2]
+    max_radius = tier_radii.max()
+
+    event_latitudes, event_longitudes, event_magnitudes, event_years = prepare_events(
+        earthquake_data=earthquake_data, start_year=start_year, end_year=end_year,
+        min_magnitude=tier_magnitudes.min())
+    number_of_years = end_year - start_year + 1
+
+    # Square tiles of the raster keep the bounding box of a block small in both latitude and longitude
+    tile_size = math.isqrt(block_size)
+    for row_start in range(0, latitudes.size, tile_size):
+        for column_start in range(0, longitudes.size, tile_size):
+            tile = (slice(row_start, row_start + tile_size), slice(column_start, column_start + tile_size))
+            block_latitudes, block_longitudes = np.meshgrid(latitudes[tile[0]], longitudes[tile[1]], indexing='ij')
+            block_latitudes = block_latitudes.ravel()
+            block_longitudes = block_longitudes.ravel()
+            # Keep only events that can be within the largest payout radius of at least one grid point of the block
+            nearby = get_nearby_event_mask(event_latitudes=event_latitudes, event_longitudes=event_longitudes,
+                                           block_latitudes=block_latitudes, block_longitudes=block_longitudes,
+                                           radius=max_radius)
+            if not nearby.any():
+                continue
+            distances = get_pairwise_haversine_distances(latitudes=block_latitudes, longitudes=block_longitudes,
+                                                         event_latitudes=event_latitudes[nearby],
+                                                         event_longitudes=event_longitudes[nearby])
+            # Highest payout triggered by every (grid point, event) pair
+            event_payouts = np.zeros(distances.shape)
+            for radius, magnitude, payout in zip(tier_radii, tier_magnitudes, tier_payouts):
+                triggered = (distances <= radius) & (event_magnitudes[nearby] >= magnitude)
+                np.maximum(event_payouts, np.where(triggered, payout, 0), out=event_payouts)
+            # Events are sorted by year: take the highest payout of each year, then sum over the years
+            _, year_starts = np.unique(event_years[nearby], return_index=True)
+            yearly_payouts = np.maximum.reduceat(event_payouts, year_starts, axis=1)
+            burning_costs[tile] = (yearly_payouts.sum(axis=1) / number_of_years).reshape(
+                burning_costs[tile].shape)
+
+    return burning_costs
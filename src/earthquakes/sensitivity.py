@@ -0,0 +1,82 @@
+# import from standard library
+# import from installed packages
+import numpy as np
+
+# import from project
+from earthquakes.tools import prepare_events, get_nearby_event_mask, get_pairwise_haversine_distances, \
+    LATITUDE_COLUMN, LONGITUDE_COLUMN
+
+
+def compute_burning_cost_sensitivity(portfolio, payouts_structure, earthquake_data, start_year, end_year,
+                                     radius_shifts, magnitude_shifts):
+    """
+    Function to compute the burning cost of every asset of a portfolio when all the radii and all the magnitude
+    thresholds of the payouts structure are shifted. For a shift (dr, dm), every tier [radius, magnitude, payout]
+    becomes [radius + dr, magnitude + dm, payout], which gives the same result as calling get_haversine_distance,
+    compute_payouts and compute_burning_cost with the shifted structure. Distances are computed once per asset and
+    events are sorted by distance, so that each shift only costs a lookup in the sorted data.
+
+    :param portfolio: dataframe of assets with latitude and longitude columns in decimal degrees
+    :param payouts_structure: the base payouts structure that defines how much is paid per year. List of lists.
+    :param earthquake_data: the historical earthquake data, with time, latitude, longitude and magnitude columns
+    :param start_year: First year to calculate burning cost
+    :param end_year: Last year to calculate burning cost
+    :param radius_shifts: list of shifts in kilometers added to every tier radius, e.g. [-10, 0, 10]
+    :param magnitude_shifts: list of shifts added to every tier magnitude threshold, e.g. [-0.1, 0, 0.1]
+    :return: 3-D numpy array of burning costs, indexed by asset, radius shift and magnitude shift
+    """
+    if not payouts_structure:
+        raise ValueError('Provided payouts structure is empty.')
+    if start_year > end_year:
+        raise ValueError('Start year must be lower than or equal to end year.')
+    radius_shifts = np.asarray(radius_shifts, dtype=float)
+    magnitude_shifts = np.asarray(magnitude_shifts, dtype=float)
+    if radius_shifts.ndim != 1 or magnitude_shifts.ndim != 1 or not radius_shifts.size or not magnitude_shifts.size:
+        raise ValueError('Radius and magnitude shifts must be non-empty lists of numbers.')
+    missing_columns = {LATITUDE_COLUMN, LONGITUDE_COLUMN} - set(portfolio.columns)
+    if missing_columns:
+        raise ValueError(f"Portfolio is missing columns: {sorted(missing_columns)}")
+
+    tiers = np.asarray(payouts_structure, dtype=float)
+    tier_radii, tier_magnitudes, tier_payouts = tiers[:, 0], tiers[:, 1], tiers[:, 2]
+    # Shifted radii, shape (tiers, radius shifts), and magnitude thresholds, shape (tiers, magnitude shifts)
+    shifted_radii = tier_radii[:, np.newaxis] + radius_shifts[np.newaxis, :]
+    shifted_magnitudes = tier_magnitudes[:, np.newaxis] + magnitude_shifts[np.newaxis, :]
+    max_radius = shifted_radii.max()
+
+    event_latitudes, event_longitudes, event_magnitudes, event_years = prepare_events(
+        earthquake_data=earthquake_data, start_year=start_year, end_year=end_year,
+        min_magnitude=shifted_magnitudes.min())
+    number_of_years = end_year - start_year + 1
+
+    asset_latitudes = portfolio[LATITUDE_COLUMN].to_numpy(dtype=float)
+    asset_longitudes = portfolio[LONGITUDE_COLUMN].to_numpy(dtype=float)
+    burning_costs = np.zeros((asset_latitudes.size, radius_shifts.size, magnitude_shifts.size))
+    if max_radius < 0:
+        return burning_costs
+
+    for asset, (latitude, longitude) in enumerate(zip(asset_latitudes, asset_longitudes)):
+        nearby = get_nearby_event_mask(event_latitudes=event_latitudes, event_longitudes=event_longitudes,
+                                       block_latitudes=np.array([latitude]), block_longitudes=np.array([longitude]),
+                                       radius=max_radius)
+        if not nearby.any():
+            continue
+        distances = get_pairwise_haversine_distances(latitudes=np.array([latitude]), longitudes=np.array([longitude]),
+                                                     event_latitudes=event_latitudes[nearby],
+                                                     event_longitudes=event_longitudes[nearby])[0]
+        by_distance = np.argsort(distances, kind='stable')
+        distances = distances[by_distance]
+        year_indices = event_years[nearby][by_distance] - start_year
+        # Highest magnitude of each year among the k nearest events, for k from 0 to the number of nearby events
+        max_magnitudes = np.full((number_of_years, distances.size + 1), -np.inf)
+        max_magnitudes[year_indices, np.arange(1, distances.size + 1)] = event_magnitudes[nearby][by_distance]
+        np.maximum.accumulate(max_magnitudes, axis=1, out=max_magnitudes)
+
+        # Number of events within every shifted radius, shape (tiers, radius shifts)
+        cutoffs = np.searchsorted(distances, shifted_radii, side='right')
+        # Shape (years, tiers, radius shifts, magnitude shifts)
+        triggered = max_magnitudes[:, cutoffs][..., np.newaxis] >= shifted_magnitudes[np.newaxis, :, np.newaxis, :]
+        yearly_payouts = np.where(triggered, tier_payouts[np.newaxis, :, np.newaxis, np.newaxis], 0).max(axis=1)
+        burning_costs[asset] = yearly_payouts.sum(axis=0) / number_of_years
+
+    return burning_costs
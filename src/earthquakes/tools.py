@@ -27,6 +27,12 @@ NUMBER_SEISMIC_STATIONS_MAGNITUDE_COLUMN = 'magNst'
 STATUS_COLUMN = 'status'
 LOCATION_SOURCE_COLUMN = 'locationSource'
 MAGNITUDE_SOURCE_COLUMN = 'magSource'
+FELT_REPORTS_COLUMN = 'felt'
+COMMUNITY_INTENSITY_COLUMN = 'cdi'
+INSTRUMENTAL_INTENSITY_COLUMN = 'mmi'
+ALERT_LEVEL_COLUMN = 'alert'
+TSUNAMI_COLUMN = 'tsunami'
+SIGNIFICANCE_COLUMN = 'sig'
 DISTANCE_COLUMN = "distance"
 LATITUDE_COLUMN = "latitude"
 LONGITUDE_COLUMN = "longitude"
@@ -77,6 +83,72 @@ def get_haversine_distance(latitude_list, longitude_list, point_latitude, point_
     return distances
 
 
+def get_pairwise_haversine_distances(latitudes, longitudes, event_latitudes, event_longitudes):
+    """
+    Function to calculate the haversine distances between every point of interest and every event
+
+    :param latitudes: numpy array of latitudes for the points of interest in decimal degrees
+    :param longitudes: numpy array of longitudes for the points of interest in decimal degrees
+    :param event_latitudes: numpy array of latitudes for the events in decimal degrees
+    :param event_longitudes: numpy array of longitudes for the events in decimal degrees
+    :return: 2-D numpy array of distances in kilometers, one row per point and one column per event
+    """
+    lat = np.deg2rad(latitudes)[:, np.newaxis]
+    lon = np.deg2rad(longitudes)[:, np.newaxis]
+    latl = np.deg2rad(event_latitudes)[np.newaxis, :]
+    lonl = np.deg2rad(event_longitudes)[np.newaxis, :]
+    d = np.sin((latl - lat) / 2) ** 2 + np.cos(lat) * np.cos(latl) * np.sin((lonl - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(d))
+
+
+def get_nearby_event_mask(event_latitudes, event_longitudes, block_latitudes, block_longitudes, radius):
+    """
+    Function to select events inside the bounding box of a block of points, widened by a radius. The box is a
+    superset of the events that are within the radius of at least one point of the block.
+
+    :param event_latitudes: numpy array of latitudes for the events in decimal degrees
+    :param event_longitudes: numpy array of longitudes for the events in decimal degrees
+    :param block_latitudes: numpy array of latitudes for the points of the block in decimal degrees
+    :param block_longitudes: numpy array of longitudes for the points of the block in decimal degrees
+    :param radius: distance in kilometers
+    :return: boolean numpy array, True for events that may be within the radius
+    """
+    margin = np.rad2deg(radius / EARTH_RADIUS)
+    min_latitude = block_latitudes.min() - margin
+    max_latitude = block_latitudes.max() + margin
+    nearby = (event_latitudes >= min_latitude) & (event_latitudes <= max_latitude)
+    # Longitude degrees shrink towards the poles, use the widest margin found in the latitude band
+    widest_latitude = min(max(abs(min_latitude), abs(max_latitude)), 90)
+    if widest_latitude < 90:
+        longitude_margin = margin / np.cos(np.deg2rad(widest_latitude))
+        min_longitude = block_longitudes.min() - longitude_margin
+        max_longitude = block_longitudes.max() + longitude_margin
+        # Do not prune on longitude when the box wraps around the antimeridian
+        if min_longitude >= -180 and max_longitude <= 180:
+            nearby &= (event_longitudes >= min_longitude) & (event_longitudes <= max_longitude)
+    return nearby
+
+
+def prepare_events(earthquake_data, start_year, end_year, min_magnitude):
+    """
+    Function to extract the events of a catalog that can trigger a payout over a time range
+
+    :param earthquake_data: the historical earthquake data, with time, latitude, longitude and magnitude columns
+    :param start_year: First year of the time range
+    :param end_year: Last year of the time range
+    :param min_magnitude: lowest magnitude that can trigger a payout
+    :return: a tuple of numpy arrays (latitudes, longitudes, magnitudes, years), sorted by year
+    """
+    years = pd.to_datetime(earthquake_data[TIME_COLUMN]).dt.year.to_numpy()
+    magnitudes = earthquake_data[MAGNITUDE_COLUMN].to_numpy(dtype=float)
+    kept = np.flatnonzero((years >= start_year) & (years <= end_year) & (magnitudes >= min_magnitude))
+    kept = kept[np.argsort(years[kept], kind='stable')]
+    return (earthquake_data[LATITUDE_COLUMN].to_numpy(dtype=float)[kept],
+            earthquake_data[LONGITUDE_COLUMN].to_numpy(dtype=float)[kept],
+            magnitudes[kept],
+            years[kept])
+
+
 def compute_payouts(earthquake_data, payouts_structure, return_type='dict'):
     """
     Function to calculate payouts over the years according to earthquake data and a payout structure
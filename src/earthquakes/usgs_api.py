@@ -6,11 +6,8 @@
 import copy
 import urllib.parse
 import urllib.request
-from io import BytesIO
 # import from installed packages
-import pandas as pd
-import asyncio
-import aiohttp
+# pandas, asyncio and aiohttp are imported inside the functions that need them to keep URL building cheap
 # import from project
 
 # TODO: refactor API params in separate file and use them in tests
@@ -154,6 +151,8 @@ def get_earthquake_data(**kwargs):
     :return: Returns a dataframe of the requested earthquake events if the API request is successful,
     and none otherwise
     """
+    import pandas as pd
+    from earthquakes.parsers import check_response_format, parse_response
     # If an end date is provided, set the start date with an offset
     if END_DATE_ARG in kwargs:
         # Set number of years to go back from end_date
@@ -166,6 +165,8 @@ def get_earthquake_data(**kwargs):
     # If the format type is not specified, add it
     if FORMAT_ARG not in kwargs:
         kwargs[FORMAT_ARG] = 'csv'
+    # Check that the response format can be parsed before sending any request
+    check_response_format(kwargs[FORMAT_ARG])
     # set the correct method for the API
     method = 'query'
     # build the api url with the correct method and desired parameters
@@ -174,7 +175,7 @@ def get_earthquake_data(**kwargs):
     response = urllib.request.urlopen(api_url)
     # if HTTP response code is 200 (meaning success) then save dataframe
     if response.status == 200:
-        response_df = pd.read_csv(BytesIO(response.read()))
+        response_df = parse_response(content=response.read(), response_format=kwargs[FORMAT_ARG])
     # else set return to None
     else:
         response_df = None
@@ -184,6 +185,10 @@ def get_earthquake_data(**kwargs):
 
 
 async def get_earthquake_data_for_multiple_locations(assets, **kwargs):
+    import asyncio
+    import aiohttp
+    import pandas as pd
+    from earthquakes.parsers import check_response_format
     # If an end date is provided, set the start date with an offset
     if END_DATE_ARG in kwargs:
         # Set number of years to go back from end_date
@@ -196,6 +201,8 @@ async def get_earthquake_data_for_multiple_locations(assets, **kwargs):
     # If the format type is not specified, add it
     if FORMAT_ARG not in kwargs:
         kwargs[FORMAT_ARG] = 'csv'
+    # Check that the response format can be parsed before sending any request
+    check_response_format(kwargs[FORMAT_ARG])
 
     async with aiohttp.ClientSession() as session:
         tasks = []
@@ -208,17 +215,19 @@ async def get_earthquake_data_for_multiple_locations(assets, **kwargs):
             # build the api url with the correct method and desired parameters
             api_url = build_api_url(method=method, arguments=kwargs)
             tasks.append(asyncio.ensure_future(get_earthquake_data_async(session=session,
-                                                                         url=api_url)))
+                                                                         url=api_url,
+                                                                         response_format=kwargs[FORMAT_ARG])))
         earthquake_data_assets_list = await asyncio.gather(*tasks)
         earthquake_data_assets = pd.concat(earthquake_data_assets_list, ignore_index=True).drop_duplicates()
     return earthquake_data_assets
 
 
-async def get_earthquake_data_async(session, url):
+async def get_earthquake_data_async(session, url, response_format='csv'):
+    from earthquakes.parsers import parse_response
     async with session.get(url) as response:
         if response.status == 200:
-            response_csv = await response.read()
-            response_df = pd.read_csv(BytesIO(response_csv))
+            response_content = await response.read()
+            response_df = parse_response(content=response_content, response_format=response_format)
         else:
             response_df = None
         return response_df
@@ -0,0 +1,43 @@
+# import from standard library
+# import from installed packages
+import pytest
+import pandas as pd
+# import from project
+from earthquakes.tools import get_haversine_distance, compute_payouts, compute_burning_cost
+from earthquakes.tools import TIME_COLUMN, LATITUDE_COLUMN, LONGITUDE_COLUMN, MAGNITUDE_COLUMN, DISTANCE_COLUMN
+
+
+@pytest.fixture
+def sample_catalog():
+    return pd.DataFrame([
+        ["2021-10-12T09:24:05.099Z", 35.1691, 26.2152, 6.4],
+        ["2021-10-03T14:31:27.622Z", 35.1442, 25.2375, 4.6],
+        ["2021-09-29T11:54:48.885Z", 35.0268, 25.1561, 4.6],
+        ["2020-09-28T15:13:16.867Z", 35.2054, 25.2791, 4.7],
+        ["2016-09-28T04:48:08.650Z", 35.0817, 25.2018, 7],
+        ["2018-03-01T00:00:00.000Z", 38.0, 23.7, 6.0],
+        ["2010-01-01T00:00:00.000Z", 35.1, 25.2, 6.8],
+    ],
+        columns=[TIME_COLUMN, LATITUDE_COLUMN, LONGITUDE_COLUMN, MAGNITUDE_COLUMN]
+    )
+
+
+@pytest.fixture
+def sample_payouts_structure():
+    return [[10, 4.5, 100], [50, 5.5, 75], [200, 6.5, 50]]
+
+
+@pytest.fixture
+def compute_reference_burning_cost():
+    """
+    Reference burning cost of a single location, computed with get_haversine_distance, compute_payouts and
+    compute_burning_cost
+    """
+    def compute(earthquake_data, payouts_structure, latitude, longitude, start_year, end_year):
+        earthquake_data = earthquake_data.copy()
+        earthquake_data[DISTANCE_COLUMN] = get_haversine_distance(
+            latitude_list=earthquake_data[LATITUDE_COLUMN], longitude_list=earthquake_data[LONGITUDE_COLUMN],
+            point_latitude=latitude, point_longitude=longitude)
+        payouts = compute_payouts(earthquake_data=earthquake_data, payouts_structure=payouts_structure)
+        return compute_burning_cost(payouts=payouts, start_year=start_year, end_year=end_year)
+    return compute
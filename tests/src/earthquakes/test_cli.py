@@ -0,0 +1,107 @@
+# import from standard library
+import subprocess
+import sys
+# import from installed packages
+import pytest
+import numpy as np
+import pandas as pd
+# import from project
+from earthquakes.cli import main, build_parser, ASSET_COLUMN, YEAR_COLUMN, BURNING_COST_COLUMN
+from earthquakes.parsers import PARSERS
+from earthquakes.tools import LATITUDE_COLUMN, LONGITUDE_COLUMN, PAYOUT_COLUMN
+
+TIERS = ['--tier', '10', '4.5', '100', '--tier', '50', '5.5', '75', '--tier', '200', '6.5', '50']
+
+
+@pytest.fixture
+def sample_files(tmp_path, sample_catalog):
+    portfolio = pd.DataFrame({ASSET_COLUMN: ['heraklion', 'athens'], LATITUDE_COLUMN: [35.0258, 37.9838],
+                              LONGITUDE_COLUMN: [25.1861, 23.7275]})
+    catalog_path = tmp_path / 'catalog.csv'
+    portfolio_path = tmp_path / 'portfolio.csv'
+    sample_catalog.to_csv(catalog_path, index=False)
+    portfolio.to_csv(portfolio_path, index=False)
+    return catalog_path, portfolio_path
+
+
+def get_imported_modules(args):
+    code = f"import sys\nfrom earthquakes.cli import main\ntry:\n    main({args!r})\nexcept SystemExit:\n    pass\n" \
+           f"print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+class TestLazyImports:
+    def test_help(self):
+        modules = get_imported_modules(['--help'])
+        assert 'pandas' not in modules
+        assert 'earthquakes.parsers' not in modules
+        assert 'aiohttp' not in modules
+
+    def test_cache_hit(self, tmp_path):
+        output = tmp_path / 'catalog.csv'
+        output.write_text('')
+        modules = get_imported_modules(['fetch', '--latitude', '35', '--longitude', '25', '--output', str(output)])
+        assert 'pandas' not in modules
+        assert 'aiohttp' not in modules
+
+    def test_usgs_api_url(self):
+        code = "import sys\nfrom earthquakes.usgs_api import build_api_url\nprint(' '.join(sys.modules))"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        assert 'pandas' not in result.stdout.split()
+
+
+class TestFetch:
+    @pytest.mark.parametrize('response_format', sorted(PARSERS))
+    def test_supported_formats(self, response_format):
+        args = build_parser().parse_args(['fetch', '--latitude', '35', '--longitude', '25',
+                                          '--format', response_format, '--output', 'catalog.csv'])
+        assert args.format == response_format
+
+    def test_unsupported_format(self, tmp_path, capsys):
+        with pytest.raises(SystemExit) as error:
+            main(['fetch', '--latitude', '35', '--longitude', '25', '--format', 'kml',
+                  '--output', str(tmp_path / 'catalog.csv')])
+        assert error.value.code == 2
+        assert 'invalid choice' in capsys.readouterr().err
+
+
+class TestPrice:
+    def test_payouts(self, sample_files, tmp_path):
+        catalog_path, portfolio_path = sample_files
+        output = tmp_path / 'payouts.csv'
+        assert main(['price', '--portfolio', str(portfolio_path), '--catalog', str(catalog_path), *TIERS,
+                     '--output', str(output)]) == 0
+        payouts = pd.read_csv(output)
+        assert list(payouts.columns) == [ASSET_COLUMN, YEAR_COLUMN, PAYOUT_COLUMN]
+        heraklion = payouts[payouts[ASSET_COLUMN] == 'heraklion'].set_index(YEAR_COLUMN)[PAYOUT_COLUMN]
+        assert heraklion.to_dict() == {2010: 100, 2011: 0, 2012: 0, 2013: 0, 2014: 0, 2015: 0, 2016: 100, 2017: 0,
+                                       2018: 0, 2019: 0, 2020: 0, 2021: 100}
+        athens = payouts[payouts[ASSET_COLUMN] == 'athens'].set_index(YEAR_COLUMN)[PAYOUT_COLUMN]
+        assert athens[2018] == 100
+        assert athens.drop(2018).eq(0).all()
+
+
+class TestBurningCost:
+    def test_burning_cost(self, sample_files, tmp_path):
+        catalog_path, portfolio_path = sample_files
+        output = tmp_path / 'burning_cost.csv'
+        assert main(['burning-cost', '--portfolio', str(portfolio_path), '--catalog', str(catalog_path), *TIERS,
+                     '--start-year', '2016', '--end-year', '2021', '--output', str(output)]) == 0
+        burning_costs = pd.read_csv(output)
+        assert list(burning_costs[ASSET_COLUMN]) == ['heraklion', 'athens']
+        assert np.allclose(burning_costs[BURNING_COST_COLUMN], [200 / 6, 100 / 6])
+
+    def test_missing_tier(self, sample_files):
+        catalog_path, portfolio_path = sample_files
+        with pytest.raises(SystemExit):
+            main(['burning-cost', '--portfolio', str(portfolio_path), '--catalog', str(catalog_path),
+                  '--start-year', '2016', '--end-year', '2021'])
+
+    def test_invalid_portfolio(self, sample_files, tmp_path):
+        catalog_path, _ = sample_files
+        portfolio_path = tmp_path / 'invalid_portfolio.csv'
+        pd.DataFrame({LATITUDE_COLUMN: [35.0]}).to_csv(portfolio_path, index=False)
+        with pytest.raises(ValueError):
+            main(['burning-cost', '--portfolio', str(portfolio_path), '--catalog', str(catalog_path), *TIERS,
+                  '--start-year', '2016', '--end-year', '2021'])
@@ -0,0 +1,131 @@
+# import from standard library
+import json
+# import from installed packages
+import pytest
+import numpy as np
+import pandas as pd
+# import from project
+from earthquakes.parsers import parse_response, check_response_format, CSV_COLUMNS, GEOJSON_ONLY_COLUMNS
+from earthquakes.tools import TIME_COLUMN, LATITUDE_COLUMN, LONGITUDE_COLUMN, DEPTH_COLUMN, MAGNITUDE_COLUMN, \
+    MAGNITUDE_TYPE_COLUMN, EVENT_IDENTIFIER_COLUMN, PLACE_COLUMN, EVENT_TYPE_COLUMN, TIME_UPDATED_COLUMN, \
+    STATUS_COLUMN, NUMBER_SEISMIC_STATIONS_LOCATION_COLUMN, FELT_REPORTS_COLUMN, ALERT_LEVEL_COLUMN, \
+    MAGNITUDE_SOURCE_COLUMN
+
+SHARED_COLUMNS = [TIME_COLUMN, LATITUDE_COLUMN, LONGITUDE_COLUMN, DEPTH_COLUMN, MAGNITUDE_COLUMN,
+                  MAGNITUDE_TYPE_COLUMN, NUMBER_SEISMIC_STATIONS_LOCATION_COLUMN, EVENT_IDENTIFIER_COLUMN,
+                  TIME_UPDATED_COLUMN, PLACE_COLUMN, EVENT_TYPE_COLUMN, STATUS_COLUMN]
+
+
+def dump_geojson(geojson, separators=(',', ':'), sort_keys=False):
+    # The USGS API returns compact JSON with keys in the order of the fixture
+    return json.dumps(geojson, separators=separators, sort_keys=sort_keys, ensure_ascii=False).encode()
+
+
+@pytest.fixture
+def sample_responses():
+    csv = b'time,latitude,longitude,depth,mag,magType,nst,gap,dmin,rms,net,id,updated,place,type,horizontalError,' \
+          b'depthError,magError,magNst,status,locationSource,magSource\n' \
+          b'2021-10-12T09:24:05.099Z,35.1691,26.2152,20,6.4,mww,,19,0.86,0.46,us,us6000ftxu,' \
+          b'2021-12-18T19:58:57.040Z,"4 km SW of Palekastro, Greece",earthquake,6.1,1.8,0.048,42,reviewed,us,us\n' \
+          b'2021-10-03T14:31:27.622Z,35.1442,25.2375,10,4.6,mb,,119,0.318,0.64,us,us6000fsp1,' \
+          b'2021-12-10T21:14:19.040Z,"2 km W of Arkalochori, Greece",earthquake,5,1.9,0.165,13,reviewed,us,us\n'
+    features = [
+        {"type": "Feature",
+         "properties": {"mag": 6.4, "place": "4 km SW of Palekastro, Greece", "time": 1634030645099,
+                        "updated": 1639857537040, "tz": None, "felt": 181, "cdi": 5.8, "mmi": 6.471,
+                        "alert": "green", "status": "reviewed", "tsunami": 0, "sig": 713, "net": "us",
+                        "code": "6000ftxu", "ids": ",us6000ftxu,", "nst": None, "dmin": 0.86, "rms": 0.46,
+                        "gap": 19, "magType": "mww", "type": "earthquake", "title": "M 6.4 - Greece"},
+         "geometry": {"type": "Point", "coordinates": [26.2152, 35.1691, 20]},
+         "id": "us6000ftxu"},
+        {"type": "Feature",
+         "properties": {"mag": 4.6, "place": "2 km W of Arkalochori, Greece", "time": 1633271487622,
+                        "updated": 1639170859040, "tz": None, "felt": None, "cdi": None, "mmi": None,
+                        "alert": None, "status": "reviewed", "tsunami": 0, "sig": 326, "net": "us",
+                        "code": "6000fsp1", "ids": ",us6000fsp1,", "nst": None, "dmin": 0.318, "rms": 0.64,
+                        "gap": 119, "magType": "mb", "type": "earthquake", "title": "M 4.6 - Greece"},
+         "geometry": {"type": "Point", "coordinates": [25.2375, 35.1442, 10]},
+         "id": "us6000fsp1"},
+    ]
+    geojson = {"type": "FeatureCollection",
+               "metadata": {"generated": 1640000000000, "url": "https://earthquake.usgs.gov/", "title": "USGS",
+                            "status": 200, "api": "1.13.1", "count": 2},
+               "features": features,
+               "bbox": [25.2375, 35.1442, 10, 26.2152, 35.1691, 20]}
+    text = b'#EventID|Time|Latitude|Longitude|Depth/km|Author|Catalog|Contributor|ContributorID|MagType|Magnitude|' \
+           b'MagAuthor|EventLocationName|EventType\n' \
+           b'us6000ftxu|2021-10-12T09:24:05.099|35.1691|26.2152|20.0|us|us|us|us6000ftxu|mww|6.4|us|' \
+           b'4 km SW of Palekastro, Greece|earthquake\n'
+    return csv, geojson, text
+
+
+class TestParseResponse:
+    def test_csv(self, sample_responses):
+        csv, _, _ = sample_responses
+        earthquake_data = parse_response(content=csv, response_format='csv')
+        assert list(earthquake_data.columns) == CSV_COLUMNS
+        assert earthquake_data[TIME_COLUMN].iloc[0] == '2021-10-12T09:24:05.099Z'
+
+    def test_geojson_matches_csv(self, sample_responses):
+        csv, geojson, _ = sample_responses
+        csv_data = parse_response(content=csv, response_format='csv')
+        geojson_data = parse_response(content=dump_geojson(geojson), response_format='geojson')
+        assert list(geojson_data.columns) == CSV_COLUMNS + GEOJSON_ONLY_COLUMNS
+        pd.testing.assert_frame_equal(geojson_data[SHARED_COLUMNS], csv_data[SHARED_COLUMNS], check_dtype=False)
+
+    def test_geojson_only_columns(self, sample_responses):
+        _, geojson, _ = sample_responses
+        geojson_data = parse_response(content=dump_geojson(geojson), response_format='geojson')
+        assert np.allclose(geojson_data[FELT_REPORTS_COLUMN], [181, np.nan], equal_nan=True)
+        assert geojson_data[ALERT_LEVEL_COLUMN].iloc[0] == 'green'
+        assert pd.isna(geojson_data[ALERT_LEVEL_COLUMN].iloc[1])
+        assert geojson_data[MAGNITUDE_SOURCE_COLUMN].isna().all()
+
+    def test_geojson_missing_property(self, sample_responses):
+        _, geojson, _ = sample_responses
+        expected = parse_response(content=dump_geojson(geojson), response_format='geojson')
+        del geojson['features'][1]['properties']['mag']
+        geojson_data = parse_response(content=dump_geojson(geojson), response_format='geojson')
+        assert np.isnan(geojson_data[MAGNITUDE_COLUMN].iloc[1])
+        pd.testing.assert_frame_equal(geojson_data.drop(columns=MAGNITUDE_COLUMN),
+                                      expected.drop(columns=MAGNITUDE_COLUMN))
+
+    @pytest.mark.parametrize('separators, sort_keys', [((', ', ': '), False), ((',', ' :'), False),
+                                                       ((',', ':'), True)])
+    def test_geojson_layout(self, sample_responses, separators, sort_keys):
+        _, geojson, _ = sample_responses
+        expected = parse_response(content=dump_geojson(geojson), response_format='geojson')
+        geojson_data = parse_response(content=dump_geojson(geojson, separators=separators, sort_keys=sort_keys),
+                                      response_format='geojson')
+        pd.testing.assert_frame_equal(geojson_data, expected)
+
+    def test_geojson_escaped_strings(self, sample_responses):
+        _, geojson, _ = sample_responses
+        geojson['features'][0]['properties']['place'] = 'Kasos "Greece", \\ "type":"Point" Κάσος'
+        geojson_data = parse_response(content=dump_geojson(geojson), response_format='geojson')
+        assert geojson_data[PLACE_COLUMN].iloc[0] == 'Kasos "Greece", \\ "type":"Point" Κάσος'
+        assert list(geojson_data[EVENT_TYPE_COLUMN]) == ['earthquake', 'earthquake']
+
+    def test_geojson_empty(self, sample_responses):
+        _, geojson, _ = sample_responses
+        geojson['features'] = []
+        geojson_data = parse_response(content=dump_geojson(geojson), response_format='geojson')
+        assert geojson_data.empty
+        assert list(geojson_data.columns) == CSV_COLUMNS + GEOJSON_ONLY_COLUMNS
+
+    def test_text(self, sample_responses):
+        csv, _, text = sample_responses
+        csv_data = parse_response(content=csv, response_format='csv')
+        text_data = parse_response(content=text, response_format='text')
+        columns = [TIME_COLUMN, LATITUDE_COLUMN, LONGITUDE_COLUMN, DEPTH_COLUMN, MAGNITUDE_COLUMN,
+                   EVENT_IDENTIFIER_COLUMN, PLACE_COLUMN, EVENT_TYPE_COLUMN]
+        pd.testing.assert_frame_equal(text_data[columns], csv_data[columns].iloc[:1], check_dtype=False)
+
+    def test_unsupported_format(self, sample_responses):
+        with pytest.raises(ValueError):
+            parse_response(content=b'<q:quakeml/>', response_format='quakeml')
+
+    def test_check_response_format(self):
+        check_response_format('geojson')
+        with pytest.raises(ValueError):
+            check_response_format('quakeml')
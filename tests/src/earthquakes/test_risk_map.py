@@ -0,0 +1,73 @@
+# import from standard library
+# import from installed packages
+import pytest
+import numpy as np
+# import from project
+from earthquakes.risk_map import get_grid_coordinates, compute_burning_cost_map
+
+
+@pytest.fixture
+def bounding_box():
+    return {'min_latitude': 34.5, 'max_latitude': 36, 'min_longitude': 24, 'max_longitude': 26.5}
+
+
+class TestGetGridCoordinates:
+    def test_bounds_included(self):
+        latitudes, longitudes = get_grid_coordinates(min_latitude=34.8, max_latitude=41.75, min_longitude=19.4,
+                                                     max_longitude=28.25, resolution=0.05)
+        assert latitudes.size == 140
+        assert longitudes.size == 178
+        assert np.isclose(latitudes[-1], 41.75)
+        assert np.isclose(longitudes[-1], 28.25)
+
+    def test_invalid_resolution(self):
+        with pytest.raises(ValueError):
+            get_grid_coordinates(min_latitude=34, max_latitude=35, min_longitude=24, max_longitude=25, resolution=0)
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            get_grid_coordinates(min_latitude=35, max_latitude=34, min_longitude=24, max_longitude=25, resolution=1)
+        with pytest.raises(ValueError):
+            get_grid_coordinates(min_latitude=34, max_latitude=95, min_longitude=24, max_longitude=25, resolution=1)
+
+
+class TestComputeBurningCostMap:
+    def test_matches_per_point_computation(self, sample_catalog, sample_payouts_structure, bounding_box,
+                                           compute_reference_burning_cost):
+        burning_costs = compute_burning_cost_map(**bounding_box, resolution=0.25,
+                                                 payouts_structure=sample_payouts_structure,
+                                                 earthquake_data=sample_catalog, start_year=2010, end_year=2021,
+                                                 block_size=7)
+        latitudes, longitudes = get_grid_coordinates(**bounding_box, resolution=0.25)
+        assert burning_costs.shape == (latitudes.size, longitudes.size)
+        for i, latitude in enumerate(latitudes):
+            for j, longitude in enumerate(longitudes):
+                expected = compute_reference_burning_cost(sample_catalog, sample_payouts_structure, latitude,
+                                                          longitude, start_year=2010, end_year=2021)
+                assert np.isclose(burning_costs[i, j], expected)
+
+    def test_block_size_does_not_change_result(self, sample_catalog, sample_payouts_structure, bounding_box):
+        burning_costs = [compute_burning_cost_map(**bounding_box, resolution=0.1,
+                                                  payouts_structure=sample_payouts_structure,
+                                                  earthquake_data=sample_catalog, start_year=2015, end_year=2021,
+                                                  block_size=block_size)
+                         for block_size in [1, 13, 10000]]
+        assert np.allclose(burning_costs[0], burning_costs[1])
+        assert np.allclose(burning_costs[0], burning_costs[2])
+
+    def test_no_nearby_events(self, sample_catalog, sample_payouts_structure):
+        burning_costs = compute_burning_cost_map(min_latitude=-10, max_latitude=-9, min_longitude=100,
+                                                 max_longitude=101, resolution=0.5,
+                                                 payouts_structure=sample_payouts_structure,
+                                                 earthquake_data=sample_catalog, start_year=2010, end_year=2021)
+        assert np.array_equal(burning_costs, np.zeros((3, 3)))
+
+    def test_empty_payouts_structure(self, sample_catalog, bounding_box):
+        with pytest.raises(ValueError):
+            compute_burning_cost_map(**bounding_box, resolution=0.25, payouts_structure=[],
+                                     earthquake_data=sample_catalog, start_year=2010, end_year=2021)
+
+    def test_invalid_years(self, sample_catalog, sample_payouts_structure, bounding_box):
+        with pytest.raises(ValueError):
+            compute_burning_cost_map(**bounding_box, resolution=0.25, payouts_structure=sample_payouts_structure,
+                                     earthquake_data=sample_catalog, start_year=2021, end_year=2010)
@@ -0,0 +1,67 @@
+# import from standard library
+# import from installed packages
+import pytest
+import numpy as np
+import pandas as pd
+# import from project
+from earthquakes.sensitivity import compute_burning_cost_sensitivity
+from earthquakes.tools import LATITUDE_COLUMN, LONGITUDE_COLUMN
+
+
+@pytest.fixture
+def sample_portfolio():
+    return pd.DataFrame({LATITUDE_COLUMN: [35.0258, 35.3387, 37.9838, 48.8566],
+                         LONGITUDE_COLUMN: [25.1861, 25.1442, 23.7275, 2.3522]})
+
+
+class TestComputeBurningCostSensitivity:
+    def test_matches_shifted_structures(self, sample_catalog, sample_portfolio, sample_payouts_structure,
+                                        compute_reference_burning_cost):
+        radius_shifts = [-10, 0, 10, 30]
+        magnitude_shifts = [-0.2, 0, 0.1, 0.5]
+        burning_costs = compute_burning_cost_sensitivity(portfolio=sample_portfolio,
+                                                         payouts_structure=sample_payouts_structure,
+                                                         earthquake_data=sample_catalog, start_year=2011,
+                                                         end_year=2021, radius_shifts=radius_shifts,
+                                                         magnitude_shifts=magnitude_shifts)
+        assert burning_costs.shape == (4, 4, 4)
+        for asset, (latitude, longitude) in enumerate(zip(sample_portfolio[LATITUDE_COLUMN],
+                                                          sample_portfolio[LONGITUDE_COLUMN])):
+            for radius_index, radius_shift in enumerate(radius_shifts):
+                for magnitude_index, magnitude_shift in enumerate(magnitude_shifts):
+                    shifted_structure = [[radius + radius_shift, magnitude + magnitude_shift, payout]
+                                         for radius, magnitude, payout in sample_payouts_structure]
+                    expected = compute_reference_burning_cost(sample_catalog, shifted_structure, latitude,
+                                                              longitude, start_year=2011, end_year=2021)
+                    assert np.isclose(burning_costs[asset, radius_index, magnitude_index], expected)
+        assert burning_costs.any()
+        assert not burning_costs[3].any()
+
+    def test_no_shift(self, sample_catalog, sample_portfolio, sample_payouts_structure):
+        burning_costs = compute_burning_cost_sensitivity(portfolio=sample_portfolio,
+                                                         payouts_structure=sample_payouts_structure,
+                                                         earthquake_data=sample_catalog, start_year=2016,
+                                                         end_year=2021, radius_shifts=[0], magnitude_shifts=[0])
+        # Heraklion is paid 100 in 2016 and 2021 only
+        assert np.isclose(burning_costs[0, 0, 0], 200 / 6)
+
+    def test_negative_radius(self, sample_catalog, sample_portfolio, sample_payouts_structure):
+        burning_costs = compute_burning_cost_sensitivity(portfolio=sample_portfolio,
+                                                         payouts_structure=sample_payouts_structure,
+                                                         earthquake_data=sample_catalog, start_year=2016,
+                                                         end_year=2021, radius_shifts=[-500], magnitude_shifts=[0])
+        assert not burning_costs.any()
+
+    def test_invalid_inputs(self, sample_catalog, sample_portfolio, sample_payouts_structure):
+        kwargs = {'portfolio': sample_portfolio, 'payouts_structure': sample_payouts_structure,
+                  'earthquake_data': sample_catalog, 'start_year': 2016, 'end_year': 2021, 'radius_shifts': [0],
+                  'magnitude_shifts': [0]}
+        with pytest.raises(ValueError):
+            compute_burning_cost_sensitivity(**{**kwargs, 'payouts_structure': []})
+        with pytest.raises(ValueError):
+            compute_burning_cost_sensitivity(**{**kwargs, 'start_year': 2022})
+        with pytest.raises(ValueError):
+            compute_burning_cost_sensitivity(**{**kwargs, 'radius_shifts': []})
+        with pytest.raises(ValueError):
+            compute_burning_cost_sensitivity(**{**kwargs,
+                                                'portfolio': sample_portfolio.drop(columns=LATITUDE_COLUMN)})
@@ -3,7 +3,7 @@ from datetime import datetime
 # import from installed packages
 import pytest
 # import from project
-from earthquakes.usgs_api import build_api_url, FORMAT_ARG, START_DATE_ARG, END_DATE_ARG, LATITUDE_ARG, \
+from earthquakes.usgs_api import build_api_url, get_earthquake_data, FORMAT_ARG, START_DATE_ARG, END_DATE_ARG, LATITUDE_ARG, \
     LONGITUDE_ARG, MAX_RADIUS_KM_ARG
 
 
@@ -77,3 +77,9 @@ class TestBuildApiUrl:
                 build_api_url(method=method, arguments=args)
             del args[param]
 
+
+class TestGetEarthquakeData:
+    def test_unsupported_format(self):
+        # kml is a valid API format without a parser, the error is raised before any request
+        with pytest.raises(ValueError):
+            get_earthquake_data(latitude=35.2, longitude=25.1, radius=5, format='kml')